@@ -143,7 +143,7 @@ async def async_setup(hass, config):
         _LOGGER.info("Slide Cloud API not configured")
         return True
 
-    hass.data[DOMAIN] = {}
+    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][SLIDES] = {}
 
     username = config[DOMAIN][CONF_USERNAME]
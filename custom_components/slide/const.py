@@ -4,6 +4,9 @@ from homeassistant.const import Platform
 
 API_CLOUD = "api_cloud"
 API_LOCAL = "api_local"
+ATTR_MAX_POSITION = "max_position"
+ATTR_MEAN_POSITION = "mean_position"
+ATTR_MIN_POSITION = "min_position"
 ATTR_STRENGTH = "strength"
 ATTR_TOUCHGO = "touchgo"
 COMPONENT_PLATFORM = Platform.COVER
@@ -13,6 +16,7 @@ CONF_VERIFY_SSL = "verify_ssl"
 DOMAIN = "slide"
 SLIDES = "slides"
 SLIDES_LOCAL = "slides_local"
+ZONES = "zones"
 DEFAULT_OFFSET = 0.15
 DEFAULT_RETRY = 120
 SERVICE_CALIBRATE = "calibrate"
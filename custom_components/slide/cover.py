@@ -1,5 +1,6 @@
 """Support for Slide slides."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -22,16 +23,20 @@ from homeassistant.const import (
     STATE_OPEN,
     STATE_OPENING,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import slugify
 
 from .const import (
     API_CLOUD,
     API_LOCAL,
+    ATTR_MAX_POSITION,
+    ATTR_MEAN_POSITION,
+    ATTR_MIN_POSITION,
     ATTR_STRENGTH,
     ATTR_TOUCHGO,
     CONF_API_VERSION,
@@ -42,6 +47,7 @@ from .const import (
     SERVICE_STRENGTH,
     SERVICE_TOUCHGO,
     SLIDES,
+    ZONES,
 )
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
@@ -131,16 +137,33 @@ async def async_setup_platform(
         if slide_info is not None:
             _LOGGER.debug("Setup Slide '%s' successful", cover[CONF_HOST])
 
-            async_add_entities(
-                [
-                    SlideCoverLocal(
-                        hass.data[DOMAIN][API_LOCAL],
-                        slide_info,
-                        cover[CONF_HOST],
-                        cover[CONF_INVERT_POSITION],
-                    )
-                ]
-            )
+            zone = None
+            zone_new = False
+
+            # Group the Slide in its zone, the first Slide of a zone creates it
+            zone_name = slide_info.get("zone_name")
+            if zone_name:
+                zone_id = slugify(zone_name)
+                zones = hass.data[DOMAIN].setdefault(ZONES, {})
+                if zone_id not in zones:
+                    _LOGGER.debug("Setting up Slide zone '%s'", zone_name)
+                    zones[zone_id] = SlideCoverZone(zone_name)
+                    zone_new = True
+                zone = zones[zone_id]
+
+            entities = [
+                SlideCoverLocal(
+                    hass.data[DOMAIN][API_LOCAL],
+                    slide_info,
+                    cover[CONF_HOST],
+                    cover[CONF_INVERT_POSITION],
+                    zone,
+                )
+            ]
+            if zone_new:
+                entities.append(zone)
+
+            async_add_entities(entities)
         else:
             _LOGGER.error("Unable to setup Slide '%s'", cover[CONF_HOST])
     else:
@@ -258,7 +281,12 @@ class SlideCoverLocal(CoverEntity):
     _attr_device_class = CoverDeviceClass.CURTAIN
 
     def __init__(
-        self, api: GoSlideLocal, slide_info: dict[str, Any], host: str, invert: bool
+        self,
+        api: GoSlideLocal,
+        slide_info: dict[str, Any],
+        host: str,
+        invert: bool,
+        zone: "SlideCoverZone | None" = None,
     ) -> None:
         """Initialize the cover."""
         self._api = api
@@ -268,12 +296,13 @@ class SlideCoverLocal(CoverEntity):
         self._slide["online"] = False
         self._slide["touchgo"] = False
         self._unique_id = None
+        self._zone = zone
 
         self.parsedata(slide_info)
 
         self._id = host
         self._invert = invert
-        self._name = host
+        self._name = slide_info.get("device_name") or host
         if self._unique_id is None:
             _LOGGER.error(
                 "Unable to setup Slide Local '%s', the MAC is missing in the slide response",
@@ -296,6 +325,16 @@ class SlideCoverLocal(CoverEntity):
         """Return device specific state attributes."""
         return {ATTR_ID: self._id, ATTR_TOUCHGO: self._slide["touchgo"]}
 
+    async def async_added_to_hass(self) -> None:
+        """Register the Slide with its zone."""
+        if self._zone is not None:
+            self._zone.async_add_member(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the Slide from its zone."""
+        if self._zone is not None:
+            self._zone.async_remove_member(self)
+
     @property
     def is_opening(self) -> bool:
         """Return if the cover is opening or not."""
@@ -333,11 +372,13 @@ class SlideCoverLocal(CoverEntity):
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
         self._slide["state"] = STATE_OPENING
+        self._update_zone()
         await self._api.slide_open(self._id)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
         self._slide["state"] = STATE_CLOSING
+        self._update_zone()
         await self._api.slide_close(self._id)
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
@@ -355,6 +396,7 @@ class SlideCoverLocal(CoverEntity):
                 self._slide["state"] = STATE_CLOSING
             else:
                 self._slide["state"] = STATE_OPENING
+            self._update_zone()
 
         await self._api.slide_set_position(self._id, position)
 
@@ -376,6 +418,13 @@ class SlideCoverLocal(CoverEntity):
                 str(err),
             )
 
+        self._update_zone()
+
+    def _update_zone(self) -> None:
+        """Push the current state of the Slide to its zone."""
+        if self._zone is not None and self.hass is not None:
+            self._zone.async_update_member(self)
+
     def parsedata(self, slide_info) -> None:
 
         self._slide["online"] = False
@@ -390,6 +439,18 @@ class SlideCoverLocal(CoverEntity):
             oldpos = self._slide.get("pos")
             self._slide["online"] = True
             self._slide["touchgo"] = slide_info["touch_go"]
+
+            # Zones are only determined during setup
+            zone_name = slide_info.get("zone_name", "")
+            if "zone_name" in self._slide and zone_name != self._slide["zone_name"]:
+                _LOGGER.warning(
+                    "Slide '%s' moved from zone '%s' to '%s', restart Home Assistant to update the zones",
+                    self._id,
+                    self._slide["zone_name"],
+                    zone_name,
+                )
+            self._slide["zone_name"] = zone_name
+
             self._slide["pos"] = slide_info["pos"]
             self._slide["pos"] = max(0, min(1, self._slide["pos"]))
 
@@ -456,3 +517,225 @@ class SlideCoverLocal(CoverEntity):
     async def async_touchgo(self, **kwargs) -> None:
         """TouchGo the Slide."""
         await self._api.slide_set_touchgo(self._id, kwargs[ATTR_TOUCHGO])
+
+
+class SlideCoverZone(CoverEntity):
+    """Representation of a zone of Slide Local API covers.
+
+    The aggregates are kept as running values, so a state change of one
+    member is applied in constant time instead of recomputing the zone.
+    """
+
+    _attr_assumed_state = True
+    _attr_device_class = CoverDeviceClass.CURTAIN
+    _attr_should_poll = False
+
+    def __init__(self, zone_name: str) -> None:
+        """Initialize the zone."""
+        self._name = zone_name
+        self._unique_id = f"zone_{slugify(zone_name)}"
+        self._members: dict[SlideCoverLocal, tuple[int, str] | None] = {}
+        self._entity_ids: list[str] = []
+
+        # Running aggregates over the members with a known position
+        self._count = 0
+        self._total = 0
+        self._histogram = [0] * 101
+        self._min: int | None = None
+        self._max: int | None = None
+        self._opening = 0
+        self._closing = 0
+        self._closed = 0
+
+    @property
+    def unique_id(self) -> str | None:
+        """Return the zone unique id."""
+        return self._unique_id
+
+    @property
+    def name(self) -> str:
+        """Return the zone name."""
+        return self._name
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return zone specific state attributes."""
+        return {
+            ATTR_ENTITY_ID: self._entity_ids,
+            ATTR_MIN_POSITION: self._min,
+            ATTR_MAX_POSITION: self._max,
+            ATTR_MEAN_POSITION: self.current_cover_position,
+        }
+
+    @property
+    def is_opening(self) -> bool:
+        """Return if any Slide in the zone is opening."""
+        return self._opening > 0
+
+    @property
+    def is_closing(self) -> bool:
+        """Return if any Slide in the zone is closing."""
+        return self._closing > 0
+
+    @property
+    def is_closed(self) -> bool:
+        """Return None if status is unknown, True if all Slides are closed."""
+        if self._count == 0:
+            return None
+        return self._closed == self._count
+
+    @property
+    def available(self) -> bool:
+        """Return False if no Slide in the zone is available."""
+        return self._count > 0
+
+    @property
+    def current_cover_position(self) -> int | None:
+        """Return the mean position of the Slides in the zone."""
+        if self._count == 0:
+            return None
+        return round(self._total / self._count)
+
+    @callback
+    def async_add_member(self, member: SlideCoverLocal) -> None:
+        """Add a Slide to the zone."""
+        self._members[member] = None
+        self._entity_ids = [entity.entity_id for entity in self._members]
+        self.async_update_member(member)
+
+    @callback
+    def async_remove_member(self, member: SlideCoverLocal) -> None:
+        """Remove a Slide from the zone."""
+        if member not in self._members:
+            return
+        self._remove_contribution(self._members.pop(member))
+        self._entity_ids = [entity.entity_id for entity in self._members]
+        self._async_write_state()
+
+    @callback
+    def async_update_member(self, member: SlideCoverLocal) -> None:
+        """Apply the current state of a Slide to the zone aggregates."""
+        if member not in self._members:
+            return
+
+        contribution = None
+        if member.available and member.current_cover_position is not None:
+            if member.is_opening:
+                state = STATE_OPENING
+            elif member.is_closing:
+                state = STATE_CLOSING
+            elif member.is_closed:
+                state = STATE_CLOSED
+            else:
+                state = STATE_OPEN
+            contribution = (member.current_cover_position, state)
+
+        if contribution == self._members[member]:
+            return
+
+        self._remove_contribution(self._members[member])
+        self._add_contribution(contribution)
+        self._members[member] = contribution
+        self._async_write_state()
+
+    def _add_contribution(self, contribution: tuple[int, str] | None) -> None:
+        """Add the position and state of a Slide to the aggregates."""
+        if contribution is None:
+            return
+        pos, state = contribution
+
+        self._count += 1
+        self._total += pos
+        self._histogram[pos] += 1
+        if self._min is None or pos < self._min:
+            self._min = pos
+        if self._max is None or pos > self._max:
+            self._max = pos
+        self._count_state(state, 1)
+
+    def _remove_contribution(self, contribution: tuple[int, str] | None) -> None:
+        """Remove the position and state of a Slide from the aggregates."""
+        if contribution is None:
+            return
+        pos, state = contribution
+
+        self._count -= 1
+        self._total -= pos
+        self._histogram[pos] -= 1
+        self._count_state(state, -1)
+
+        if self._count == 0:
+            self._min = None
+            self._max = None
+            return
+
+        # Positions are 0-100, so finding the next extreme is bounded
+        if self._histogram[pos] == 0:
+            if pos == self._min:
+                while self._histogram[self._min] == 0:
+                    self._min += 1
+            if pos == self._max:
+                while self._histogram[self._max] == 0:
+                    self._max -= 1
+
+    def _count_state(self, state: str, delta: int) -> None:
+        """Adjust the state counters."""
+        if state == STATE_OPENING:
+            self._opening += delta
+        elif state == STATE_CLOSING:
+            self._closing += delta
+        elif state == STATE_CLOSED:
+            self._closed += delta
+
+    def _async_write_state(self) -> None:
+        """Write the zone state if the zone is added to Home Assistant."""
+        if self.hass is not None and self.entity_id is not None:
+            self.async_write_ha_state()
+
+    async def _async_fan_out(self, method: str, **kwargs: Any) -> None:
+        """Call a method on all Slides in the zone."""
+        members = list(self._members)
+        results = await asyncio.gather(
+            *(getattr(member, method)(**kwargs) for member in members),
+            return_exceptions=True,
+        )
+
+        # Update the Slides the same way as a command to the Slide itself, this
+        # also corrects the state of a Slide where the command failed
+        for member, result in zip(members, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Unable to send command to Slide '%s' in zone '%s': %s",
+                    member._id,
+                    self._name,
+                    str(result),
+                )
+            member.async_schedule_update_ha_state(True)
+
+    async def async_open_cover(self, **kwargs: Any) -> None:
+        """Open all Slides in the zone."""
+        await self._async_fan_out("async_open_cover", **kwargs)
+
+    async def async_close_cover(self, **kwargs: Any) -> None:
+        """Close all Slides in the zone."""
+        await self._async_fan_out("async_close_cover", **kwargs)
+
+    async def async_stop_cover(self, **kwargs: Any) -> None:
+        """Stop all Slides in the zone."""
+        await self._async_fan_out("async_stop_cover", **kwargs)
+
+    async def async_set_cover_position(self, **kwargs: Any) -> None:
+        """Move all Slides in the zone to a specific position."""
+        await self._async_fan_out("async_set_cover_position", **kwargs)
+
+    async def async_calibrate(self) -> None:
+        """Calibrate all Slides in the zone."""
+        await self._async_fan_out("async_calibrate")
+
+    async def async_strength(self, **kwargs) -> None:
+        """Motor strength for all Slides in the zone."""
+        await self._async_fan_out("async_strength", **kwargs)
+
+    async def async_touchgo(self, **kwargs) -> None:
+        """TouchGo all Slides in the zone."""
+        await self._async_fan_out("async_touchgo", **kwargs)